@@ -22,15 +22,187 @@
   - Text wrapping: Optional text wrapping based on terminal 
     width.
 
-  For unittests see `unittests/msg-test.py`.
+  For unittests see `unittests/msg-test.py` and
+  `unittests/test_*.py`.
 
 """
 __version__ = '0.8.2'
 import sys
-import colorama
+import re
+import functools
+import weakref
 from shutil import get_terminal_size
 import textwrap as tw
 
+# Matches anything that textwrap would alter in a line that already
+# fits: non-space whitespace, runs of spaces, a trailing space, or a
+# sentence ending that `fix_sentence_endings` would double-space.
+_NEEDS_FILL = re.compile(r'[^\S ]|  | \Z|[a-z][.!?]["\']? ').search
+
+# Whitespace other than the ascii kinds `_flatten()` translates, eg.
+# '\xa0' or '\u3000'.  textwrap drops a chunk of it where the chunk
+# strips to nothing, so lines with any are left to textwrap.
+_ODD_SPACE = re.compile(r'[^\S\t\n\x0b\x0c\r ]').search
+
+# Whitespace translation and sentence-ending gap used by `_flatten()`.
+_WS_TRANS = str.maketrans('\t\n\x0b\x0c\r', '     ')
+_SENTENCE_GAP = re.compile(r'(?<=[a-z][.!?]) (?! )|(?<=[a-z][.!?]["\']) (?! )').sub
+
+def _flatten(line:str) -> str:
+  # What textwrap produces for `line` when it does not need wrapping:
+  # tabs expanded, whitespace turned into spaces, sentence endings
+  # double-spaced, and trailing whitespace dropped.
+  return _SENTENCE_GAP('  ', line.expandtabs().translate(_WS_TRANS)).rstrip(' ')
+
+# Colour sequences embedded in message text, which take up no columns.
+_STRIP_SGR = re.compile(r'\x1b\[[0-9;]*m').sub
+
+def _visible_len(text:str) -> int:
+  # Columns `text` takes up on the terminal.  Plain text, by far the
+  # most common, costs a single scan for the escape character.
+  return len(_STRIP_SGR('', text)) if '\x1b' in text else len(text)
+
+def _fits(line:str, ppref_len:int, cols:int) -> bool:
+  # True if `line` can be written as-is after a `ppref_len` prefix: not
+  # empty, within `cols` (colour sequences in it take no columns), and
+  # with nothing textwrap would alter.
+  if not line:
+    return False
+  return ((len(line) + ppref_len <= cols
+      or _visible_len(line) + ppref_len <= cols) and not _NEEDS_FILL(line))
+
+def _fast_wrap(text:str, width:int) -> list:
+  # Word wrap of `_flatten()`ed text, giving the same lines as textwrap
+  # for text without hyphens or leading whitespace.  Every character is
+  # one column wide, so each line is taken as a `width` slice and only
+  # adjusted back to the last space in it.  Returns None if a word is
+  # wider than `width` and would need breaking.
+  lines:list = []
+  append = lines.append
+  end:int = len(text)
+  i:int = 0
+  while end - i > width:
+    span = text[i:i + width]
+    if text[i + width] == ' ':
+      cut = width
+    else:
+      cut = span.rfind(' ')
+      if cut < 0: return None
+    append(span[:cut].rstrip(' '))
+    i += cut
+    # Whitespace at the break is dropped, as textwrap does.
+    while text[i] == ' ': i += 1
+  append(text[i:])
+  return lines
+
+# Set once `colorama.init()` has been called; see `Msg.enable_color()`.
+_colorama_inited = False
+
+# SGR parameter codes for the colour names accepted by `set_colors()`
+# (the same names and values as colorama's Fore, Back and Style).
+_COLORS = ('BLACK', 'RED', 'GREEN', 'YELLOW', 'BLUE', 'MAGENTA', 'CYAN', 'WHITE')
+_FORE_CODE  = {**{c: str(30 + i) for i, c in enumerate(_COLORS)},
+               **{f'LIGHT{c}_EX': str(90 + i) for i, c in enumerate(_COLORS)},
+               'RESET': '39'}
+_BACK_CODE  = {**{c: str(40 + i) for i, c in enumerate(_COLORS)},
+               **{f'LIGHT{c}_EX': str(100 + i) for i, c in enumerate(_COLORS)},
+               'RESET': '49'}
+_STYLE_CODE = {'BRIGHT': '1', 'DIM': '2', 'NORMAL': '22', 'RESET_ALL': '0'}
+
+# Colour name to ansi code tables, keyed by colour kind.
+_COLOR_TABLES = {kind: {name: f'\x1b[{code}m' for name, code in codes.items()}
+    for kind, codes in (('fore', _FORE_CODE), ('back', _BACK_CODE),
+                        ('style', _STYLE_CODE))}
+_FORE, _BACK, _STYLE = (_COLOR_TABLES[k] for k in ('fore', 'back', 'style'))
+_RESET_ALL = _STYLE['RESET_ALL']
+
+# Keyword arguments accepted by `Msg.set_colors()`.
+_COLOR_KEYS = frozenset(f'{msg_type}_{kind}'
+    for msg_type in ('msg', 'info', 'warn', 'error')
+    for kind in ('fore', 'back', 'style'))
+
+_SGR = re.compile(r'\x1b\[([0-9;]+)m')
+
+def _join_sgr(*codes:str) -> str:
+  # Merges simple SGR escape codes into one sequence, eg. '\x1b[40m',
+  # '\x1b[37m' -> '\x1b[40;37m'.  Anything else is just concatenated.
+  params = []
+  for code in codes:
+    match = _SGR.fullmatch(code)
+    if match is None:
+      return ''.join(codes)
+    params.append(match.group(1))
+  return f"\x1b[{';'.join(params)}m" if params else ''
+
+def _format_lines(buf:list, args:tuple, ppref:str, textwrap_cols:int, wrapper) -> None:
+  # Appends each of `args`, prefixed and wrapped at `textwrap_cols`, to
+  # `buf`.  A plain function of its arguments, so the per-line loop can
+  # be compiled or replaced without touching `Msg`; `wrapper` is the
+  # TextWrapper used for lines the fast paths can't handle.
+  ppref_len:int = len(ppref)
+  # Local bindings for the per-line loop.
+  append = buf.append
+  fits = _fits
+  odd_space = _ODD_SPACE
+  flatten = _flatten
+  visible_len = _visible_len
+  line:str
+  for line in args:
+    # Anything that isn't a string is printed as its str() value.
+    if type(line) is not str: line = f'{line}'
+    # Lines that already fit are emitted as-is, skipping textwrap.
+    # Each output line goes into `buf` as a single piece.
+    if fits(line, ppref_len, textwrap_cols):
+      append(f'{ppref}{line}\n')
+      continue
+    # Lines that fit once normalised (always, when not wrapping) are
+    # also emitted without running textwrap.
+    if not odd_space(line):
+      flat = flatten(line)
+      if (len(flat) + ppref_len <= textwrap_cols
+          or visible_len(flat) + ppref_len <= textwrap_cols):
+        append(f'{ppref}{flat}\n' if flat else '\n')
+        continue
+      if (textwrap_cols > ppref_len and not flat.startswith(' ')
+          and '-' not in flat):
+        wrapped = _fast_wrap(flat, textwrap_cols - ppref_len)
+        if wrapped is not None:
+          for wl in wrapped:
+            append(f'{ppref}{wl}\n')
+          continue
+    wrapper.width = textwrap_cols
+    wrapper.initial_indent = wrapper.subsequent_indent = ppref
+    # An empty result still prints as a blank line.
+    for wrapped in wrapper.wrap(line) or ('',):
+      append(f'{wrapped}\n')
+
+@functools.lru_cache(maxsize=32)
+def _sgr_table(*colors:str) -> dict:
+  # Combined colour sequence for each message type, from the back, fore
+  # and style codes of msg, info, warn and error in that order.  Cached,
+  # so the default colours are only combined once per process; the
+  # returned dict is shared and must not be modified.
+  return {msg_type: _join_sgr(*colors[i:i+3])
+      for msg_type, i in (('', 0), ('info', 3), ('warn', 6), ('error', 9))}
+
+def _color_property(key:str) -> property:
+  # Public colour attribute `key` (eg. 'info_fore'), stored in the slot
+  # '_<key>'.  Assigning it rebuilds the combined colour sequences and
+  # the writers, as `set_colors()` does.
+  slot = f'_{key}'
+  def fget(self) -> str:
+    return getattr(self, slot)
+  def fset(self, value:str) -> None:
+    setattr(self, slot, value)
+    self._rebuild_sgr()
+    self._rebuild_writers()
+  return property(fget, fset)
+
+@functools.lru_cache(maxsize=32)
+def _rule(char:str, cols:int) -> str:
+  # Cached ruler strings for `Msg.line()`.
+  return char * cols
+
 class Msg:
   """
   Attributes:
@@ -41,6 +213,8 @@ class Msg:
     use_color (bool): Enable or disable colour in messages.
     use_textwrap (bool): Enable or disable text wrapping.
     prefixes (list): List of global prefixes for messages.
+        Reading it gives a copy; use the `prefix_*` methods, or
+        assign a new list, to change prefixes.
     prefix_separator (str): Separator used between prefixes.
     msg_fore, msg_back, msg_style (str): Standard message 
         colours and style.
@@ -54,6 +228,7 @@ class Msg:
   Methods:
     set_columns(newcolumns: int): Set terminal column size.
     set_rows(newrows: int): Set terminal row size.
+    rebind_streams(out, err): Set the default output streams.
     enable_color(color_enable: bool): Enable/disable colour.
     msg, info, warn, error: Print messages of different types.
     line: Print lines.
@@ -71,19 +246,32 @@ class Msg:
     ```
 
   Dependencies:
-    The class requires the `colorama` package for colour 
-    handling.  Colours can also be set using abbreviations
-    (see `set_colors()`).
+    Colour sequences are built in, with the same names and 
+    values as colorama's Fore, Back and Style, so colorama 
+    values or abbreviations (see `set_colors()`) can be used.
+    The `colorama` package is optional, and only used on 
+    Windows, when colour is enabled, to set up the console.
     
     The class also requires modules `sys`, `shutil`, and `textwrap`. 
 
   """
+  __slots__ = ('version', 'columns', 'rows', '_use_color', 'use_textwrap',
+      '_prefixes', '_prefix_separator',
+      '_msg_fore', '_msg_back', '_msg_style', '_info_fore', '_info_back', '_info_style',
+      '_warn_fore', '_warn_back', '_warn_style', '_error_fore', '_error_back', '_error_style',
+      '_prefix_cache', '_ppref', '_sgr', '_wrapper', '_out', '_err',
+      '_write_msg', '_write_info', '_write_warn', '_write_error', '__weakref__')
+
+  # isatty() results by stream, shared by all instances.  Weakly keyed,
+  # so a freed stream's entry can't be picked up by a later object.
+  _isatty_cache = weakref.WeakKeyDictionary()
+
   def __init__(self, columns:int=None, rows:int=None, use_color:bool=None,
       use_textwrap:bool=True, prefixes:list=[], prefix_separator:str=': ',
-      msg_fore:str=colorama.Fore.WHITE,   msg_back:str=colorama.Back.BLACK,   msg_style:str=colorama.Style.NORMAL,
-      info_fore:str=colorama.Fore.GREEN,  info_back:str=colorama.Back.BLACK,  info_style:str=colorama.Style.DIM,
-      warn_fore:str=colorama.Fore.YELLOW, warn_back:str=colorama.Back.BLACK,  warn_style:str=colorama.Style.NORMAL,
-      error_fore:str=colorama.Fore.RED,   error_back:str=colorama.Back.BLACK, error_style:str=colorama.Style.BRIGHT):
+      msg_fore:str=_FORE['WHITE'],   msg_back:str=_BACK['BLACK'],   msg_style:str=_STYLE['NORMAL'],
+      info_fore:str=_FORE['GREEN'],  info_back:str=_BACK['BLACK'],  info_style:str=_STYLE['DIM'],
+      warn_fore:str=_FORE['YELLOW'], warn_back:str=_BACK['BLACK'],  warn_style:str=_STYLE['NORMAL'],
+      error_fore:str=_FORE['RED'],   error_back:str=_BACK['BLACK'], error_style:str=_STYLE['BRIGHT']):
 
     """
     Initialises the msg object, setting default terminal size, 
@@ -93,50 +281,66 @@ class Msg:
     if columns is None:
       # Query the terminal columns size
       self.columns, _ = get_terminal_size()
-    elif columns == 0:
-      self.columns = 65536
     else:
-      self.columns = abs(columns)
+      self._set_columns_unchecked(columns)
     if not rows:
       # Query the terminal rows size
       _, self.rows = get_terminal_size()
     else:
       self.rows = abs(rows)
+    # Default output streams, resolved once per instance.
+    self._out = sys.stdout
+    self._err = sys.stderr
     if use_color is None:
       # Determine if the terminal supports colour
-      self.use_color = self.is_terminal(sys.stdout)
+      self._use_color = self.is_terminal(self._out)
     else:
-      self.use_color = use_color
+      self._use_color = use_color
     # global textwrap flag
     self.use_textwrap     = use_textwrap
+    # Shared wrapper for lines `_flatten()`/`_fast_wrap()` can't handle;
+    # both reproduce its output for exactly these options.
+    self._wrapper         = tw.TextWrapper(fix_sentence_endings=True,
+        break_long_words=True, break_on_hyphens=True)
+    # Initialise colours, needed by the writers built below; set
+    # through the slots, as the writers don't exist yet.
+    self._msg_fore        = msg_fore
+    self._msg_back        = msg_back
+    self._msg_style       = msg_style
+    self._info_fore       = info_fore
+    self._info_back       = info_back
+    self._info_style      = info_style
+    self._warn_fore       = warn_fore
+    self._warn_back       = warn_back
+    self._warn_style      = warn_style
+    self._error_fore      = error_fore
+    self._error_back      = error_back
+    self._error_style     = error_style
+    self._rebuild_sgr()
     # Initialise default message prefix and separator
-    self.prefixes         = prefixes.copy() # Using copy() to avoid mutable default argument
-    self.prefix_separator = prefix_separator
-    # Initialise colours.
-    self.msg_fore         = msg_fore
-    self.msg_back         = msg_back
-    self.msg_style        = msg_style
-    self.info_fore        = info_fore
-    self.info_back        = info_back
-    self.info_style       = info_style
-    self.warn_fore        = warn_fore
-    self.warn_back        = warn_back
-    self.warn_style       = warn_style
-    self.error_fore       = error_fore
-    self.error_back       = error_back
-    self.error_style      = error_style
+    self._prefixes         = prefixes.copy() # Using copy() to avoid mutable default argument
+    self._prefix_separator = prefix_separator
+    self._rebuild_prefix_cache()
+    self._rebuild_writers()
 
   def is_terminal(self, stream) -> bool:
     """
     Checks if a terminal is available for a given stream.
+    The result is cached per stream, across all instances.
     Args:
       stream: The stream to check for terminal availability.
     Returns:
       bool: True if a terminal is available, False otherwise.
     """
-    if not hasattr(stream, 'isatty'): return False
-    if not stream.isatty(): return False
-    return True
+    try:
+      is_tty = Msg._isatty_cache.get(stream)
+    except TypeError:
+      # Not weakly referenceable or not hashable; probe every time.
+      return hasattr(stream, 'isatty') and stream.isatty()
+    if is_tty is None:
+      is_tty = hasattr(stream, 'isatty') and stream.isatty()
+      Msg._isatty_cache[stream] = is_tty
+    return is_tty
 
   def set_columns(self, newcolumns: int) -> int:
     """ 
@@ -153,9 +357,11 @@ class Msg:
     """
     if not isinstance(newcolumns, int):
       raise ValueError("'newcolumns' must be an integer.")
-    if newcolumns == 0:
-      newcolumns = 65536
-    self.columns = abs(newcolumns)
+    return self._set_columns_unchecked(newcolumns)
+
+  def _set_columns_unchecked(self, newcolumns: int) -> int:
+    # `set_columns()` without the type check, for internal callers.
+    self.columns = abs(newcolumns) if newcolumns else 65536
     return self.columns
 
   def set_rows(self, newrows: int) -> int:
@@ -175,13 +381,30 @@ class Msg:
     self.rows = newrows
     return self.rows
 
+  def rebind_streams(self, out=None, err=None) -> None:
+    """
+    Sets the default output streams, for use after sys.stdout or
+    sys.stderr have been redirected.
+    The streams are otherwise resolved once, when the instance is
+    created.
+    Args:
+      out: Stream for msg, info and line. Defaults to sys.stdout.
+      err: Stream for warn and error. Defaults to sys.stderr.
+    Example:
+      sys.stdout = open('out.log', 'w')
+      m.rebind_streams()
+    """
+    self._out = sys.stdout if out is None else out
+    self._err = sys.stderr if err is None else err
+    self._rebuild_writers()
+
   def enable_color(self, color_enable: bool = None) -> bool:
     """
     Sets whether to print messages in colour.
     Args:
       use_color: The flag to turn on/off the colour for the print 
       messages.
-      Defaults to None. If None, uses 'is_terminal(sys.stdout)' to 
+      Defaults to None. If None, uses 'is_terminal()' on stdout to 
       determine whether to use colour.
     Returns:
       bool: The current state of use of colour.
@@ -191,14 +414,29 @@ class Msg:
       m.enable_color(True)
     """
     if color_enable is None:
-      self.use_color = is_terminal(sys.stdout)
+      self.use_color = self.is_terminal(self._out)
     else:
       self.use_color = color_enable
     # Reset colour only if turning off or turning on colour
     if self.use_color:
-       print(colorama.Style.RESET_ALL, end='')
-    # Initialize/De-initialise colour using the current state
-    colorama.init() if self.use_color else colorama.deinit()
+      self._out.write(_RESET_ALL)
+    # Terminals other than the Windows console understand ansi codes
+    # natively, so colorama is only needed on Windows.  It is set up
+    # once per process and never de-initialised; turning colour off
+    # just stops colour sequences being written.
+    global _colorama_inited
+    if self.use_color and not _colorama_inited and sys.platform == 'win32':
+      _colorama_inited = True
+      try:
+        import colorama
+      except ImportError:
+        # Without colorama, only consoles with native ansi support
+        # (Windows Terminal, recent Windows 10+) will show colour.
+        pass
+      else:
+        # just_fix_windows_console() (colorama >= 0.4.6) only enables
+        # ansi handling in the console, without wrapping the streams.
+        getattr(colorama, 'just_fix_windows_console', colorama.init)()
     return self.use_color
 
   def enable_textwrap(self, textwrap_enable: bool = None) -> bool:
@@ -273,23 +511,89 @@ class Msg:
           warn_style=colorama.Style.BRIGHT
         )
     """
+    # Check every argument before changing anything, so a bad one
+    # leaves the colours as they were.
+    colors:dict = {}
     for key, value in kwargs.items():
-      if hasattr(self, key):
-        setattr(self, key, self._get_color_code(value, 
-            colorama.Fore if key.endswith('_fore') 
-            else colorama.Back if key.endswith('_back') 
-            else colorama.Style))
-      else:
+      if key not in _COLOR_KEYS:
         raise ValueError(f'Invalid argument: {key}')
+      if not isinstance(value, str):
+        raise ValueError(f'Invalid colour for {key}: {value!r}')
+      # The key suffix ('fore', 'back' or 'style') picks the table.
+      colors[key] = self._get_color_code(value, key.rsplit('_', 1)[1])
+    # Set through the slots, rebuilding once for all keys below.
+    for key, value in colors.items():
+      setattr(self, f'_{key}', value)
+    self._rebuild_sgr()
+    self._rebuild_writers()
 
-  def _get_color_code(self, color, color_type):
-    # If it's already an ansi code, then let it go.
-    try:
-      return getattr(color_type, color.upper())
-    except AttributeError:
-      return color
+  def _rebuild_sgr(self) -> None:
+    # Combined colour sequence for each message type, keyed like `_ppref`.
+    self._sgr = _sgr_table(
+        self.msg_back,   self.msg_fore,   self.msg_style,
+        self.info_back,  self.info_fore,  self.info_style,
+        self.warn_back,  self.warn_fore,  self.warn_style,
+        self.error_back, self.error_fore, self.error_style)
+
+  # The colour attributes are properties so that assigning one directly
+  # also refreshes the colour sequences used by the writers.
+  msg_fore    = _color_property('msg_fore')
+  msg_back    = _color_property('msg_back')
+  msg_style   = _color_property('msg_style')
+  info_fore   = _color_property('info_fore')
+  info_back   = _color_property('info_back')
+  info_style  = _color_property('info_style')
+  warn_fore   = _color_property('warn_fore')
+  warn_back   = _color_property('warn_back')
+  warn_style  = _color_property('warn_style')
+  error_fore  = _color_property('error_fore')
+  error_back  = _color_property('error_back')
+  error_style = _color_property('error_style')
+
+  # `use_color` is a property so that changing it, directly or through
+  # `enable_color()`, also swaps the writers between colour and plain.
+  @property
+  def use_color(self) -> bool:
+    return self._use_color
+
+  @use_color.setter
+  def use_color(self, color_enable:bool) -> None:
+    self._use_color = color_enable
+    self._rebuild_writers()
+
+  def _rebuild_writers(self) -> None:
+    # Writers specialised for each message type; rebuilt whenever the
+    # colours, colour setting or default streams change.
+    self._write_msg   = self._make_writer(self._sgr[''], '', self._out)
+    self._write_info  = self._make_writer(self._sgr['info'], 'info', self._out)
+    self._write_warn  = self._make_writer(self._sgr['warn'], 'warn', self._err)
+    self._write_error = self._make_writer(self._sgr['error'], 'error', self._err)
+
+  def _make_writer(self, ansi:str, msg_type:str, stream):
+    # Returns a writer with colour and default stream fixed, bypassing
+    # the keyword handling in `print_msg()`.  Colour is resolved here
+    # too, so the writer goes straight to the colour or the plain
+    # emitter.  The line prefix is looked up on each call, so prefix
+    # changes don't rebuild the writers.  The writer is stored on the
+    # instance, so it takes the instance and `use_textwrap` as
+    # arguments rather than holding `self`, which would make every
+    # instance a reference cycle.
+    if self._use_color:
+      emit = type(self)._emit_color
+      def writer(msg, args:tuple, wrap:bool, file) -> None:
+        emit(msg, args, ansi, msg._ppref[msg_type], wrap,
+            stream if file is None else file)
     else:
-      return color  # Assume it's already an ANSI code.
+      emit = type(self)._emit_plain
+      def writer(msg, args:tuple, wrap:bool, file) -> None:
+        emit(msg, args, msg._ppref[msg_type], wrap,
+            stream if file is None else file)
+    return writer
+
+  def _get_color_code(self, color:str, kind:str) -> str:
+    # Resolves a colour name for `kind` ('fore', 'back' or 'style');
+    # if it's already an ansi code, then let it go.
+    return _COLOR_TABLES[kind].get(color.upper(), color)
 
   def prefix_set(self, newprefix:str) -> list:
     """
@@ -326,7 +630,8 @@ class Msg:
     """
     if not isinstance(addprefix, str):
       raise ValueError('Added Prefix must be a string.')
-    self.prefixes.append(addprefix.strip())
+    self._prefixes.append(addprefix.strip())
+    self._rebuild_prefix_cache()
     return self.prefixes
 
   def prefix_pop(self) -> list:
@@ -344,17 +649,56 @@ class Msg:
       prefs:list = m.prefix_pop()
       m.msg(prefs)
     """
-    if len(self.prefixes): self.prefixes.pop()
+    try:
+      self._prefixes.pop()
+    except IndexError:
+      pass
+    self._rebuild_prefix_cache()
     return self.prefixes
 
-  def print_msg(self, *args: any, back=None, fore=None, style=None, wrap=None, file=None, msg_type='', sep='\n', end='') -> None:
+  def _rebuild_prefix_cache(self) -> None:
+    # Joined prefix string, recomputed only when the prefixes change,
+    # plus the complete line prefix for each message type.
+    self._prefix_cache = cache = self._prefix_separator.join(self._prefixes).strip()
+    # As `_build_line_prefix()` gives, but by plain concatenation.
+    sep = self._prefix_separator
+    base = f'{cache}{sep}' if cache else ''
+    self._ppref = {'': base, 'info': f'{base}info{sep}',
+        'warn': f'{base}warn{sep}', 'error': f'{base}error{sep}'}
+
+  # `prefixes` and `prefix_separator` are properties so that assigning
+  # either one directly also refreshes the cached prefix strings.
+  # `prefixes` returns a copy, as changing the list in place would
+  # leave the cache stale.
+  @property
+  def prefixes(self) -> list:
+    return self._prefixes.copy()
+
+  @prefixes.setter
+  def prefixes(self, newprefixes:list) -> None:
+    self._prefixes = list(newprefixes)
+    self._rebuild_prefix_cache()
+
+  @property
+  def prefix_separator(self) -> str:
+    return self._prefix_separator
+
+  @prefix_separator.setter
+  def prefix_separator(self, newseparator:str) -> None:
+    self._prefix_separator = newseparator
+    self._rebuild_prefix_cache()
+
+  def print_msg(self, *args: any, back=None, fore=None, style=None, ansi=None, wrap=None, file=None, msg_type='', sep='\n', end='') -> None:
     """
     Prints a message to the terminal with optional formatting.
     This is a wrapper function is used by the `msg*` functions.
     For most purposes, use the msg* functions for printing.
     Args:
-      *args: The print message arguments.
+      *args: The print message arguments, one line each;
+          non-string values are printed as their str().
       back, fore, style: colorama formatting options.
+      ansi: Pre-concatenated colour string; overrides back, fore
+          and style.
       wrap: Enable/Disable textwrapping.
       file: The file to print to. Defaults to sys.stdout.
       msg_type: Type of message. 
@@ -366,76 +710,124 @@ class Msg:
       m.print_msg('Hello', 'World', sep=' ', end='!', fore=colorama.Fore.RED)
     """
     # Set defaults if no values were provided
-    if back  is None: back  = self.msg_back
-    if fore  is None: fore  = self.msg_fore
-    if style is None: style = self.msg_style
+    if ansi is None:
+      if back is None and fore is None and style is None:
+        ansi = self._sgr['']
+      else:
+        if back  is None: back  = self.msg_back
+        if fore  is None: fore  = self.msg_fore
+        if style is None: style = self.msg_style
+        ansi = _join_sgr(back, fore, style)
     if wrap  is None: wrap  = self.use_textwrap
+    # Resolved per call, unlike the default streams of the msg* functions.
     if file  is None: file  = sys.stdout
-    ppref = self.prefix_separator.join(self.prefixes).strip()
-    if msg_type:
-      if ppref: ppref += self.prefix_separator
-      ppref += msg_type
-    if ppref: ppref += self.prefix_separator
-    if self.use_color:
-      print(f'{back}{fore}{style}', sep='', end='', file=file)
-    textwrap_cols:int = 65534 if not wrap else self.columns
-    for line in args:
-      print(tw.fill(line, textwrap_cols, 
-                    initial_indent=ppref, 
-                    subsequent_indent=ppref,
-                    fix_sentence_endings=True),
-          file=file)
-    if self.use_color:
-      print(colorama.Style.RESET_ALL, sep='', end='', file=file)
+    self._emit(args, ansi, self._line_prefix(msg_type), wrap, file)
+
+  def _line_prefix(self, msg_type:str) -> str:
+    # Other msg_types are cached on first use until the prefixes change.
+    ppref = self._ppref.get(msg_type)
+    if ppref is None:
+      ppref = self._ppref[msg_type] = self._build_line_prefix(msg_type)
+    return ppref
+
+  def _build_line_prefix(self, msg_type:str) -> str:
+    # Line prefix: '<prefixes><sep><msg_type><sep>', skipping empty parts.
+    parts:list = [p for p in (self._prefix_cache, msg_type) if p]
+    if not parts:
+      return ''
+    parts.append('')
+    return self._prefix_separator.join(parts)
+
+  def _emit(self, args:tuple, ansi:str, ppref:str, wrap:bool, file) -> None:
+    # Writes `args` with all formatting already resolved, for
+    # `print_msg()`; the per-type writers call the emitters directly.
+    if self._use_color:
+      self._emit_color(args, ansi, ppref, wrap, file)
+    else:
+      self._emit_plain(args, ppref, wrap, file)
+
+  def _emit_color(self, args:tuple, ansi:str, ppref:str, wrap:bool, file) -> None:
+    # `_emit()` with colour sequences around the message.
+    textwrap_cols = self.columns if wrap else 65534
+    # Common case: one string that fits as-is becomes a single string;
+    # anything else, including non-strings, goes via `_format_lines()`.
+    if (len(args) == 1 and type(args[0]) is str
+        and _fits(args[0], len(ppref), textwrap_cols)):
+      self._write_buf((f'{ansi}{ppref}{args[0]}\n{_RESET_ALL}',), file)
+      return
+    # Build the whole message, then write it to `file` in one go.
+    buf:list = [ansi]
+    _format_lines(buf, args, ppref, textwrap_cols, self._wrapper)
+    buf.append(_RESET_ALL)
+    self._write_buf(buf, file)
+
+  def _emit_plain(self, args:tuple, ppref:str, wrap:bool, file) -> None:
+    # `_emit()` without colour sequences.
+    textwrap_cols = self.columns if wrap else 65534
+    if (len(args) == 1 and type(args[0]) is str
+        and _fits(args[0], len(ppref), textwrap_cols)):
+      self._write_buf((f'{ppref}{args[0]}\n',), file)
+      return
+    buf:list = []
+    _format_lines(buf, args, ppref, textwrap_cols, self._wrapper)
+    self._write_buf(buf, file)
+
+  def _write_buf(self, buf:list, file) -> None:
+    # Writes the pieces in `buf` to `file` as one string, flushing
+    # terminals so each message shows up straight away.
+    file.write(''.join(buf))
+    if self.is_terminal(file):
+      file.flush()
 
-  def msg(self, *args: any, sep='\n', end='', file=sys.stdout) -> None:
+  def msg(self, *args: any, sep='\n', end='', file=None) -> None:
     """
     Prints a message to stdout, with optional additional formatting.
     Args:
-      *args: The print message arguments.
+      *args: The message lines, written in a single call; pass
+          a list as `*lines` rather than looping over it.
     Example:
       m.msg('this is a standard message.')
     """
-    self.print_msg(*args, fore=self.msg_fore, back=self.msg_back, 
-        style=self.msg_style, sep=sep, end=end, file=file)
+    self._write_msg(self, args, self.use_textwrap, file)
 
-  def info(self, *args: any, sep='\n', end='', file=sys.stdout) -> None:
+  def info(self, *args: any, sep='\n', end='', file=None) -> None:
     """
     Prints an info message to stdout, with optional additional 
     formatting. 
     Args:
-      *args: The print message arguments.
+      *args: The message lines, written in a single call; pass
+          a list as `*lines` rather than looping over it.
     Example:
       m.info('this is an info message.')
+      m.info(*['first line', 'second line'])
     """
-    self.print_msg(*args, fore=self.info_fore, back=self.info_back, 
-        style=self.info_style, sep=sep, end=end, file=file, msg_type='info')
+    self._write_info(self, args, self.use_textwrap, file)
 
-  def warn(self, *args: any, sep='\n', end='', file=sys.stderr) -> None:
+  def warn(self, *args: any, sep='\n', end='', file=None) -> None:
     """
     Prints a warning message to stderr, with optional additional 
     formatting.
     Args:
-      *args: The print message arguments.
+      *args: The message lines, written in a single call; pass
+          a list as `*lines` rather than looping over it.
     Example:
       m.warn('this is a warning.')
     """
-    self.print_msg(*args, fore=self.warn_fore, back=self.warn_back, 
-        style=self.warn_style, sep=sep, end=end, file=file, msg_type='warn')
+    self._write_warn(self, args, self.use_textwrap, file)
 
-  def error(self, *args: any, sep='\n', end='', file=sys.stderr) -> None:
+  def error(self, *args: any, sep='\n', end='', file=None) -> None:
     """
     Prints an error message to stderr, with optional additional 
     formatting.
     Args:
-      *args: The print message arguments.
+      *args: The message lines, written in a single call; pass
+          a list as `*lines` rather than looping over it.
     Example:
       m.error('this is an error.')
     """
-    self.print_msg(*args, fore=self.error_fore, back=self.error_back, 
-        style=self.error_style, sep=sep, end=end, file=file, msg_type='error')
+    self._write_error(self, args, self.use_textwrap, file)
 
-  def line(self, cols:int=None, char:str='-', sep='\n', end='', file=sys.stdout) -> None:
+  def line(self, cols:int=None, char:str='-', sep='\n', end='', file=None) -> None:
     """
     Prints a `cols` number of 'char'.
     Args:
@@ -445,12 +837,10 @@ class Msg:
       m.line(char='_')
     """
     if cols is None: cols = self.columns
-    ppref_len = len(self.prefix_separator.join(self.prefixes).strip())
+    ppref_len = len(self._ppref[''])
     if ppref_len:
-      ppref_len += len(self.prefix_separator)
       cols = cols - ppref_len
       if cols < 1: cols = 0
-    self.print_msg(char * cols, fore=self.msg_fore, back=self.msg_back, 
-        style=self.msg_style, sep=sep, end=end, file=file, msg_type='')
+    self._write_msg(self, (_rule(char, cols),), self.use_textwrap, file)
 
 #fin
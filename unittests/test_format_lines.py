@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Unit tests for `msg._format_lines()`, checking its fast paths
+against `textwrap.TextWrapper.wrap()` over randomised lines.
+"""
+import os
+import sys
+import random
+import textwrap
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from msg import _format_lines
+
+# Pieces the random lines are built from: words, hyphens, sentence
+# ends with and without quotes, over-long words, and odd whitespace.
+_WORDS = ('a', 'to', 'the', 'message', 'terminal', 'Prefix', 'x1', '42',
+    'well-known', 'a-b-c', '-', '--', 'end.', 'why?', 'stop!', 'said."',
+    "it.'", 'Mr.', 'e.g.', 'A.', 'supercalifragilisticexpialidocious',
+    'x' * 90)
+_GAPS = (' ', ' ', ' ', ' ', '  ', '   ', '\t', ' \t ', '\n', '\r', '\x0b', '\x0c',
+    '\xa0', ' \u3000 ', '\x85')
+
+def _random_line(rnd:random.Random) -> str:
+  kind = rnd.random()
+  if kind < 0.03:
+    return ''
+  if kind < 0.06:
+    return ''.join(rnd.choice(_GAPS) for _ in range(rnd.randint(1, 4)))
+  parts = [rnd.choice(_GAPS) if rnd.random() < 0.1 else '']
+  for _ in range(rnd.randint(1, 30)):
+    parts.append(rnd.choice(_WORDS))
+    parts.append(rnd.choice(_GAPS))
+  if rnd.random() < 0.7:
+    parts.pop()
+  return ''.join(parts)
+
+def _expected(line:str, ppref:str, cols:int) -> list:
+  wrapper = textwrap.TextWrapper(width=cols, initial_indent=ppref,
+      subsequent_indent=ppref, fix_sentence_endings=True,
+      break_long_words=True, break_on_hyphens=True)
+  return [f'{wrapped}\n' for wrapped in wrapper.wrap(line) or ('',)]
+
+class FormatLinesTest(unittest.TestCase):
+
+  def test_matches_textwrap(self):
+    rnd = random.Random(20261015)
+    wrapper = textwrap.TextWrapper(fix_sentence_endings=True,
+        break_long_words=True, break_on_hyphens=True)
+    for _ in range(10000):
+      line = _random_line(rnd)
+      ppref = rnd.choice(('', 'info: ', 'myprog: warn: ', 'p' * 30 + ': '))
+      # Widths down to 1 also cover prefixes wider than the width.
+      cols = rnd.choice((rnd.randint(1, 40), rnd.randint(40, 120), 65534))
+      # TextWrapper never returns for leading whitespace once the
+      # prefix leaves no room on the line, so there's nothing to match.
+      if cols <= len(ppref) and line[:1].isspace():
+        continue
+      buf:list = []
+      _format_lines(buf, (line,), ppref, cols, wrapper)
+      self.assertEqual(buf, _expected(line, ppref, cols),
+          msg=f'line={line!r} ppref={ppref!r} cols={cols}')
+
+  def test_multiple_lines(self):
+    wrapper = textwrap.TextWrapper(fix_sentence_endings=True,
+        break_long_words=True, break_on_hyphens=True)
+    buf:list = []
+    _format_lines(buf, ('one', 2, '', 'three  four'), 'info: ', 80, wrapper)
+    self.assertEqual(buf,
+        ['info: one\n', 'info: 2\n', '\n', 'info: three  four\n'])
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Unit tests for class `msg.Msg`.
+"""
+import gc
+import io
+import os
+import sys
+import unittest
+import weakref
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from msg import Msg
+
+class MsgTest(unittest.TestCase):
+
+  def info(self, m:Msg, *args) -> str:
+    out = io.StringIO()
+    m.info(*args, file=out)
+    return out.getvalue()
+
+  def test_assign_prefixes(self):
+    m = Msg(use_color=False)
+    m.prefix_set('prog')
+    m.prefixes = ['A', 'B']
+    self.assertEqual(self.info(m, 'y'), 'A: B: info: y\n')
+
+  def test_prefixes_copy(self):
+    m = Msg(use_color=False)
+    m.prefixes.append('A')
+    m.prefix_add('B').append('C')
+    self.assertEqual(m.prefixes, ['B'])
+    self.assertEqual(self.info(m, 'y'), 'B: info: y\n')
+
+  def test_assign_prefix_separator(self):
+    m = Msg(use_color=False, prefixes=['A', 'B'])
+    m.prefix_separator = ' > '
+    self.assertEqual(self.info(m, 'y'), 'A > B > info > y\n')
+
+  def test_assign_color(self):
+    m = Msg(use_color=True)
+    m.info_fore = '\x1b[31m'
+    self.assertEqual(self.info(m, 'y'), '\x1b[40;31;2minfo: y\n\x1b[0m')
+
+  def test_weakref(self):
+    m = Msg(use_color=False)
+    self.assertIs(weakref.ref(m)(), m)
+
+  def test_no_reference_cycle(self):
+    # Instances are freed by reference counting alone.
+    gc.disable()
+    try:
+      m = Msg(use_color=False)
+      ref = weakref.ref(m)
+      del m
+      self.assertIsNone(ref())
+    finally:
+      gc.enable()
+
+  def test_write_only_file(self):
+    # Like print(), only write() is needed on the file.
+    class WriteOnly:
+      def __init__(self): self.text = ''
+      def write(self, text): self.text += text
+    for use_color in (False, True):
+      out = WriteOnly()
+      Msg(use_color=use_color).info(*[f'line {i}' for i in range(12)], file=out)
+      self.assertEqual(out.text.count('info: line'), 12)
+
+  def test_set_colors_invalid(self):
+    m = Msg(use_color=True)
+    before = self.info(m, 'y')
+    with self.assertRaises(ValueError):
+      m.set_colors(info_fore='RED', bogus=1)
+    with self.assertRaises(ValueError):
+      m.set_colors(info_fore='RED', info_back=1)
+    self.assertEqual(m.info_fore, '\x1b[32m')
+    self.assertEqual(self.info(m, 'y'), before)
+    m.set_colors(info_fore='RED')
+    self.assertEqual(self.info(m, 'y'), '\x1b[40;31;2minfo: y\n\x1b[0m')
+
+if __name__ == '__main__':
+  unittest.main()